@@ -5,42 +5,223 @@ import subprocess
 import socket
 import time
 import os
+import threading
+import functools
+import importlib
+import re
+import csv
+import io
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FutureTimeoutError
 from datetime import datetime, timedelta
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
-                             QHBoxLayout, QGridLayout, QLabel, QPushButton, 
-                             QFrame, QScrollArea, QProgressBar, QSpacerItem, QSizePolicy)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, QTimer, QRect, QPropertyAnimation, QEasingCurve
-from PyQt5.QtGui import QFont, QPalette, QColor, QPainter, QPen, QBrush, QMovie
+                             QHBoxLayout, QGridLayout, QLabel, 
+                             QFrame, QScrollArea, QProgressBar, QStackedWidget)
+from PyQt5.QtCore import (Qt, QObject, QThread, QMetaObject, pyqtSignal, pyqtSlot,
+                          QTimer, QRect, QEvent)
+from PyQt5.QtGui import QPalette, QColor, QPainter, QPixmap
 
-# Additional imports for enhanced functionality
-try:
-    import cpuinfo
-    HAS_CPUINFO = True
-except ImportError:
-    HAS_CPUINFO = False
+# Additional modules for enhanced functionality (cpuinfo, GPUtil, wmi) are
+# imported by the worker on first use; cpuinfo in particular probes the CPU
+# at import time, which would otherwise delay the first window
+@functools.lru_cache(maxsize=None)
+def _optional_module(name):
+    """Import an optional dependency, or return None if it is not installed"""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+# Errors a probe can hit on a machine that lacks a sensor, file or permission;
+# anything else is a bug and should not be silenced
+_PROBE_ERRORS = (OSError, AttributeError, TypeError, ValueError, psutil.Error)
+
+# Byte-to-unit multipliers
+_GB = 1.0 / (1024 ** 3)
+_MB = 1.0 / (1024 ** 2)
+
+# Processor brand cleanup: trademark marks and runs of whitespace
+_BRAND_RE = re.compile(r'\((?:R|TM|tm)\)')
+_WS_RE = re.compile(r'\s+')
+
+# Mount options of partitions that are never queried for usage; optical and
+# removable media can stall disk_usage() for seconds
+_SKIP_PARTITION_OPTS = frozenset({'cdrom', 'removable'})
+
+# CPU flags highlighted on the CPU Features card, matched against lowercase flags
+_KEY_CPU_FEATURES = ('avx2', 'sse4_2', 'aes', 'vmx', 'svm', 'rdrand', 'rdseed')
+
+# Loopback interface names, compared lowercase
+_SKIP_INTERFACES = frozenset({'lo', 'loopback'})
 
-try:
-    import GPUtil
-    HAS_GPUTIL = True
-except ImportError:
-    HAS_GPUTIL = False
+# Address families reported by psutil.net_if_addrs(); psutil.AF_LINK maps to
+# AF_PACKET on Linux and to the platform's link-layer family elsewhere
+_AF_INET = socket.AF_INET
+_AF_INET6 = socket.AF_INET6
+_AF_LINK = psutil.AF_LINK
 
-class SystemInfoWorker(QThread):
-    """Worker thread for gathering comprehensive system information"""
+# psutil capabilities that vary by version and platform
+_HAS_GETLOADAVG = hasattr(psutil, 'getloadavg')
+
+@functools.lru_cache(maxsize=1)
+def _get_cpu_info():
+    """Return cpuinfo's CPU details; probing can spawn a subprocess, so it runs once"""
+    cpuinfo = _optional_module('cpuinfo')
+    return cpuinfo.get_cpu_info() if cpuinfo is not None else None
+
+def _ellipsize(s, n):
+    """Shorten s to at most n characters, ending in '...' only when it was cut"""
+    return s if len(s) <= n else s[:n - 3] + "..."
+
+class SystemInfoWorker(QObject):
+    """Worker for gathering comprehensive system information on a background thread"""
     info_ready = pyqtSignal(dict)
     progress_update = pyqtSignal(str, int)  # status message, progress percentage
     
-    def run(self):
+    # CPU usage is sampled non-blocking against psutil's previous call, so the
+    # counters are primed once and recent samples are reused; the first sample
+    # waits until the priming call is old enough to span several scheduler ticks
+    CPU_SAMPLE_MIN_INTERVAL = 0.5  # seconds
+    CPU_PRIME_MIN_AGE = 0.1  # seconds
+    _cpu_primed = False
+    _cpu_primed_time = 0.0
+    _cpu_sample = None
+    _cpu_sample_time = 0.0
+    
+    # Hardware and OS identity never change during a session, so they are
+    # gathered by the first worker and reused by every refresh after it
+    _static_cache = None
+    
+    # Shellouts used by the motherboard and GPU sections; they share one
+    # deadline per refresh
+    MOTHERBOARD_COMMANDS = {
+        "Windows": ('wmic', 'baseboard', 'get', 'manufacturer,product,version,serialnumber', '/format:csv'),
+        "Linux": ('dmidecode', '-t', 'baseboard')
+    }
+    GPU_COMMANDS = {
+        "Windows": ('wmic', 'path', 'win32_VideoController', 'get', 'name'),
+        "Linux": ('lspci',)
+    }
+    COMMAND_TIMEOUT = 10  # seconds
+    
+    # The GPU name found through the shellouts is hardware identity too, so
+    # lspci/wmic run at most once per session, and only when GPUtil cannot
+    # list the GPUs
+    _gpu_name = None
+    _gpu_name_probed = False
+    DISK_USAGE_TIMEOUT = 1.0  # seconds per partition, from when its call starts
+    
+    def __init__(self):
+        super().__init__()
+        self._wmi_lock = threading.Lock()
+        self._wmi_hardware = None
+        self._wmi_queried = False
+        self._commands = {}
+        self._commands_deadline = 0.0
+        # Commands that could not be started (not installed) are not retried
+        self._unavailable_commands = set()
+        # Collector threads live as long as the worker instead of per refresh
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        # disk_usage() calls get their own pool, with threads started on
+        # demand; a mount whose call timed out is skipped until that call returns
+        self._usage_executor = ThreadPoolExecutor(max_workers=16)
+        self._stalled_mounts = {}
+        if not SystemInfoWorker._cpu_primed:
+            try:
+                psutil.cpu_percent(interval=None)
+                psutil.cpu_percent(interval=None, percpu=True)
+                SystemInfoWorker._cpu_primed = True
+                SystemInfoWorker._cpu_primed_time = time.monotonic()
+            except _PROBE_ERRORS:
+                pass
+    
+    @pyqtSlot()
+    def do_refresh(self):
+        """Gather system information and hand it back to the UI thread"""
         info = self.gather_system_info()
         self.info_ready.emit(info)
     
+    def shutdown(self):
+        """Release the collector threads once the worker thread has stopped"""
+        self._executor.shutdown(wait=False)
+        self._usage_executor.shutdown(wait=False)
+    
     def gather_system_info(self):
         """Gather comprehensive and accurate system information with progress updates"""
         info = {}
         
+        static_info = {}
+        if SystemInfoWorker._static_cache is None:
+            static_collectors = [
+                (self._collect_os, "Detected operating system"),
+                (self._collect_motherboard, "Scanned motherboard information"),
+                (self._collect_cpu_details, "Analyzed processor specifications")
+            ]
+        else:
+            static_collectors = []
+        
+        dynamic_collectors = [
+            (self._collect_uptime, "Calculated system uptime"),
+            (self._collect_cpu_usage, "Measured processor usage"),
+            (self._collect_memory, "Examined memory configuration"),
+            (self._collect_storage, "Scanned storage devices"),
+            (self._collect_gpu, "Detected graphics hardware"),
+            (self._collect_network, "Analyzed network interfaces"),
+            (self._collect_sensors, "Read power and sensor data"),
+            (self._collect_processes, "Counted system processes")
+        ]
+        
+        # Launch the shellouts before anything reads them so the child
+        # processes run side by side
+        system = platform.system()
+        commands = []
+        if system == "Linux" or (system == "Windows" and _optional_module('wmi') is None):
+            if static_collectors and system in self.MOTHERBOARD_COMMANDS:
+                commands.append(self.MOTHERBOARD_COMMANDS[system])
+            # The GPU name is only read when GPUtil cannot list the GPUs; if it
+            # is installed but finds none, the fallback starts the command itself
+            if (system in self.GPU_COMMANDS and not SystemInfoWorker._gpu_name_probed
+                    and _optional_module('GPUtil') is None):
+                commands.append(self.GPU_COMMANDS[system])
+        self._commands_deadline = time.monotonic() + self.COMMAND_TIMEOUT
+        self.start_commands(commands)
+        
+        # The sections are independent and mostly wait on subprocesses or /proc,
+        # so they run concurrently and report progress as each one completes
+        self.progress_update.emit("Scanning system hardware...", 5)
+        try:
+            futures = {}
+            for collector, status in static_collectors:
+                futures[self._executor.submit(collector)] = (status, static_info)
+            for collector, status in dynamic_collectors:
+                futures[self._executor.submit(collector)] = (status, info)
+            
+            for completed, future in enumerate(as_completed(futures), 1):
+                status, target = futures[future]
+                target.update(future.result())
+                self.progress_update.emit(status, 5 + completed * 90 // len(futures))
+        finally:
+            self.stop_commands()
+        
+        if static_collectors:
+            SystemInfoWorker._static_cache = static_info
+        info.update(SystemInfoWorker._static_cache)
+        
+        # Memory capabilities depend on both the memory and CPU sections
+        if info.get('ram_total_gb'):
+            info['memory_capabilities'] = self.get_memory_capabilities(info['ram_total_gb'], info.get('cpu_vendor', ''))
+        else:
+            info['memory_capabilities'] = {}
+        
+        self.progress_update.emit("Finalizing system analysis...", 100)
+        
+        return info
+    
+    def _collect_os(self):
+        """Collect operating system, identity and boot time details"""
+        info = {}
+        
         # Operating System Details
-        self.progress_update.emit("Detecting operating system...", 5)
-        time.sleep(0.3)  # Small delay to show progress
         try:
             info['os_name'] = platform.system()
             info['os_version'] = platform.release()
@@ -52,7 +233,7 @@ class SystemInfoWorker(QThread):
                     info['os_edition'] = platform.win32_edition()
                     if info['os_edition']:
                         info['os_full'] += f" {info['os_edition']}"
-                except:
+                except _PROBE_ERRORS:
                     pass
             else:
                 info['os_full'] = f"{platform.system()} {platform.release()}"
@@ -63,41 +244,53 @@ class SystemInfoWorker(QThread):
             
             try:
                 info['username'] = os.getlogin()
-            except:
+            except OSError:
                 info['username'] = os.environ.get('USERNAME', os.environ.get('USER', 'Unknown'))
-        except:
+        except _PROBE_ERRORS:
             info['os_full'] = "Unknown OS"
             info['os_architecture'] = "Unknown"
             info['hostname'] = "Unknown"
             info['username'] = "Unknown"
         
-        # System Uptime and Boot Time
-        self.progress_update.emit("Calculating system uptime...", 10)
-        time.sleep(0.2)
+        # Boot Time
+        try:
+            info['boot_time'] = datetime.fromtimestamp(psutil.boot_time()).strftime("%Y-%m-%d %H:%M:%S")
+        except _PROBE_ERRORS:
+            info['boot_time'] = "Unknown"
+        
+        return info
+    
+    def _collect_uptime(self):
+        """Collect system uptime"""
+        info = {}
+        
+        # System Uptime
         try:
             boot_time = psutil.boot_time()
-            uptime_seconds = time.time() - boot_time
-            uptime_delta = timedelta(seconds=uptime_seconds)
-            days = uptime_delta.days
-            hours, remainder = divmod(uptime_delta.seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            info['uptime'] = f"{days} days, {hours:02d}:{minutes:02d}"
-            info['boot_time'] = datetime.fromtimestamp(boot_time).strftime("%Y-%m-%d %H:%M:%S")
-        except:
+        except _PROBE_ERRORS:
             info['uptime'] = "Unknown"
-            info['boot_time'] = "Unknown"
+            return info
+        
+        uptime_delta = timedelta(seconds=time.time() - boot_time)
+        days = uptime_delta.days
+        hours, remainder = divmod(uptime_delta.seconds, 3600)
+        minutes, _ = divmod(remainder, 60)
+        info['uptime'] = f"{days} days, {hours:02d}:{minutes:02d}"
         
-        # Motherboard Information
-        self.progress_update.emit("Scanning motherboard information...", 20)
-        time.sleep(0.4)
-        info['motherboard'] = self.get_motherboard_info()
+        return info
+    
+    def _collect_motherboard(self):
+        """Collect motherboard details"""
+        return {'motherboard': self.get_motherboard_info()}
+    
+    def _collect_cpu_details(self):
+        """Collect processor identity, features and core counts"""
+        info = {}
         
         # Detailed Processor Information
-        self.progress_update.emit("Analyzing processor specifications...", 30)
-        time.sleep(0.5)
         try:
-            if HAS_CPUINFO:
-                cpu_info = cpuinfo.get_cpu_info()
+            cpu_info = _get_cpu_info()
+            if cpu_info is not None:
                 info['processor'] = cpu_info.get('brand_raw', platform.processor())
                 info['cpu_vendor'] = cpu_info.get('vendor_id_raw', 'Unknown')
                 info['cpu_family'] = cpu_info.get('family', 'Unknown')
@@ -114,12 +307,28 @@ class SystemInfoWorker(QThread):
             
             # Clean up processor name
             if info['processor']:
-                info['processor'] = ' '.join(info['processor'].split())
-                info['processor'] = info['processor'].replace('(R)', '').replace('(TM)', '').replace('(tm)', '').strip()
+                info['processor'] = _WS_RE.sub(' ', _BRAND_RE.sub('', info['processor'])).strip()
             
             info['cpu_cores_physical'] = psutil.cpu_count(logical=False) or 0
             info['cpu_cores_logical'] = psutil.cpu_count(logical=True) or 0
-            
+        except Exception:  # cpuinfo can fail in arbitrary ways on unusual CPUs
+            info['processor'] = "Unknown Processor"
+            info['cpu_cores_physical'] = 0
+            info['cpu_cores_logical'] = 0
+        
+        # Important CPU features; flags never change, so this is done with the
+        # rest of the cached CPU section instead of on every refresh
+        flags = frozenset(flag.lower() for flag in info.get('cpu_flags', []))
+        info['cpu_key_features'] = [feature.upper() for feature in _KEY_CPU_FEATURES
+                                    if any(feature in flag for flag in flags)]
+        
+        return info
+    
+    def _collect_cpu_usage(self):
+        """Collect processor frequency and usage"""
+        info = {}
+        
+        try:
             # CPU Frequency Information
             try:
                 cpu_freq = psutil.cpu_freq()
@@ -131,14 +340,13 @@ class SystemInfoWorker(QThread):
                     info['cpu_freq_current'] = 0
                     info['cpu_freq_max'] = 0
                     info['cpu_freq_min'] = 0
-            except:
+            except _PROBE_ERRORS:
                 info['cpu_freq_current'] = 0
                 info['cpu_freq_max'] = 0
                 info['cpu_freq_min'] = 0
             
             # CPU Usage (overall and per core)
-            info['cpu_usage'] = psutil.cpu_percent(interval=0.1)
-            info['cpu_usage_per_core'] = psutil.cpu_percent(interval=0.1, percpu=True)
+            info['cpu_usage'], info['cpu_usage_per_core'] = self.get_cpu_usage()
             
             # CPU Times
             cpu_times = psutil.cpu_times()
@@ -148,36 +356,20 @@ class SystemInfoWorker(QThread):
                 'idle': cpu_times.idle
             }
             
-        except:
-            info['processor'] = "Unknown Processor"
-            info['cpu_cores_physical'] = 0
-            info['cpu_cores_logical'] = 0
+        except _PROBE_ERRORS:
             info['cpu_usage'] = 0
             info['cpu_usage_per_core'] = []
         
-        # Memory Information with Capabilities
-        self.progress_update.emit("Examining memory configuration...", 45)
-        time.sleep(0.3)
+        return info
+    
+    def _collect_memory(self):
+        """Collect RAM and swap usage"""
+        info = {}
+        
         try:
             memory = psutil.virtual_memory()
-            info['ram_total_gb'] = memory.total / (1024**3)
-            info['ram_used_gb'] = memory.used / (1024**3)
-            info['ram_available_gb'] = memory.available / (1024**3)
-            info['ram_free_gb'] = memory.free / (1024**3)
-            info['ram_percent'] = memory.percent
-            info['ram_cached_gb'] = getattr(memory, 'cached', 0) / (1024**3)
-            info['ram_buffers_gb'] = getattr(memory, 'buffers', 0) / (1024**3)
-            
-            # Estimate memory capabilities
-            info['memory_capabilities'] = self.get_memory_capabilities(info['ram_total_gb'], info.get('cpu_vendor', ''))
-            
-            # Swap information
             swap = psutil.swap_memory()
-            info['swap_total_gb'] = swap.total / (1024**3)
-            info['swap_used_gb'] = swap.used / (1024**3)
-            info['swap_free_gb'] = swap.free / (1024**3)
-            info['swap_percent'] = swap.percent
-        except:
+        except _PROBE_ERRORS:
             info['ram_total_gb'] = 0
             info['ram_used_gb'] = 0
             info['ram_available_gb'] = 0
@@ -185,37 +377,77 @@ class SystemInfoWorker(QThread):
             info['swap_total_gb'] = 0
             info['swap_used_gb'] = 0
             info['swap_percent'] = 0
-            info['memory_capabilities'] = {}
+            return info
+        
+        # Memory Information
+        info['ram_total_gb'] = memory.total * _GB
+        info['ram_used_gb'] = memory.used * _GB
+        info['ram_available_gb'] = memory.available * _GB
+        info['ram_free_gb'] = memory.free * _GB
+        info['ram_percent'] = memory.percent
+        info['ram_cached_gb'] = getattr(memory, 'cached', 0) * _GB
+        info['ram_buffers_gb'] = getattr(memory, 'buffers', 0) * _GB
+        
+        # Swap information
+        info['swap_total_gb'] = swap.total * _GB
+        info['swap_used_gb'] = swap.used * _GB
+        info['swap_free_gb'] = swap.free * _GB
+        info['swap_percent'] = swap.percent
+        
+        return info
+    
+    def _collect_storage(self):
+        """Collect storage devices and capabilities"""
+        info = {}
         
         # Comprehensive Storage Information with Capabilities
-        self.progress_update.emit("Scanning storage devices...", 60)
-        time.sleep(0.4)
         info['storage_devices'] = []
         info['storage_capabilities'] = {}
         try:
             partitions = psutil.disk_partitions()
             total_storage = 0
             
+            # Disk I/O stats are read once for all partitions, keyed by lowercase name
+            try:
+                disk_io = {name.lower(): stats for name, stats in (psutil.disk_io_counters(perdisk=True) or {}).items()}
+            except _PROBE_ERRORS:
+                disk_io = {}
+            
+            # Query usage for all partitions in parallel so a stalled mount
+            # (absent media, dead network share) is skipped after the timeout
+            # instead of hanging the scan
+            usage_started = {}
+            usage_futures = []
             for partition in partitions:
+                # Skip floppy, optical and removable drives
+                if _SKIP_PARTITION_OPTS.intersection(partition.opts.split(',')):
+                    continue
+                if platform.system() == "Windows" and partition.device.startswith(('A:', 'B:')):
+                    continue
+                # Skip a mount whose earlier call is still stuck
+                stalled = self._stalled_mounts.get(partition.mountpoint)
+                if stalled is not None:
+                    if not stalled.done():
+                        continue
+                    del self._stalled_mounts[partition.mountpoint]
+                usage_futures.append((partition, self._usage_executor.submit(
+                    self.timed_disk_usage, partition.mountpoint, usage_started)))
+            
+            for partition, usage_future in usage_futures:
                 try:
-                    if platform.system() == "Windows":
-                        # Skip system partitions and removable drives
-                        if partition.device.startswith(('A:', 'B:')) or 'cdrom' in partition.opts:
-                            continue
-                    
-                    usage = psutil.disk_usage(partition.mountpoint)
+                    usage = self.wait_disk_usage(partition.mountpoint, usage_future, usage_started)
                     total_storage += usage.total
                     
-                    # Get disk I/O stats
-                    disk_io = psutil.disk_io_counters(perdisk=True)
+                    # Match disk I/O stats
                     device_name = partition.device.replace(':', '').replace('\\', '') if platform.system() == "Windows" else partition.device.split('/')[-1]
+                    device_name = device_name.lower()
                     
                     io_stats = None
                     for disk_name, stats in disk_io.items():
-                        if device_name.lower() in disk_name.lower():
+                        if device_name in disk_name:
                             io_stats = {
-                                'read_bytes': stats.read_bytes / (1024**3),  # GB
-                                'write_bytes': stats.write_bytes / (1024**3),  # GB
+                                'read_bytes': stats.read_bytes * _GB,  # GB
+                                'write_bytes': stats.write_bytes * _GB,  # GB
                                 'read_count': stats.read_count,
                                 'write_count': stats.write_count
                             }
@@ -225,28 +457,59 @@ class SystemInfoWorker(QThread):
                         'device': partition.device,
                         'mountpoint': partition.mountpoint,
                         'fstype': partition.fstype,
-                        'total_gb': usage.total / (1024**3),
-                        'used_gb': usage.used / (1024**3),
-                        'free_gb': usage.free / (1024**3),
-                        'percent': (usage.used / usage.total) * 100,
+                        'total_gb': usage.total * _GB,
+                        'used_gb': usage.used * _GB,
+                        'free_gb': usage.free * _GB,
+                        'percent': (usage.used / usage.total) * 100 if usage.total else 0,
                         'io_stats': io_stats
                     }
                     info['storage_devices'].append(device_info)
+                except FutureTimeoutError:
+                    # A call that never left the queue is dropped for this scan
+                    # only; one that started and hung marks its mount as stalled
+                    if not usage_future.cancel():
+                        self._stalled_mounts[partition.mountpoint] = usage_future
+                    continue
                 except (PermissionError, OSError):
                     continue
             
             # Storage capabilities
-            info['storage_capabilities'] = self.get_storage_capabilities(total_storage / (1024**3))
+            info['storage_capabilities'] = self.get_storage_capabilities(total_storage * _GB)
             
-        except:
+        except _PROBE_ERRORS:
             pass
         
+        # Card rows are formatted here so the UI thread only sets text
+        info['storage_items'] = self.format_storage_items(info['storage_devices'], info['storage_capabilities'])
+        
+        return info
+    
+    def timed_disk_usage(self, mountpoint, started):
+        """Run disk_usage(), noting when the call left the queue"""
+        started[mountpoint] = time.monotonic()
+        return psutil.disk_usage(mountpoint)
+    
+    def wait_disk_usage(self, mountpoint, future, started):
+        """Wait for a disk_usage() call, timing it from when it started running"""
+        while True:
+            # A call still in the queue gets a full timeout to start running
+            start = started.get(mountpoint)
+            deadline = (time.monotonic() if start is None else start) + self.DISK_USAGE_TIMEOUT
+            try:
+                return future.result(timeout=max(0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                if start is not None or mountpoint not in started:
+                    raise
+    
+    def _collect_gpu(self):
+        """Collect graphics devices"""
+        info = {}
+        
         # Enhanced Graphics Information
-        self.progress_update.emit("Detecting graphics hardware...", 70)
-        time.sleep(0.3)
         info['gpu_devices'] = []
         try:
-            if HAS_GPUTIL:
+            GPUtil = _optional_module('GPUtil')
+            if GPUtil is not None:
                 gpus = GPUtil.getGPUs()
                 for gpu in gpus:
                     info['gpu_devices'].append({
@@ -265,12 +528,18 @@ class SystemInfoWorker(QThread):
                 gpu_name = self.get_gpu_info()
                 if gpu_name and gpu_name != "Unknown Graphics Card":
                     info['gpu_devices'].append({'name': gpu_name})
-        except:
+        except Exception:  # GPUtil shells out to nvidia-smi and parses its output
             pass
         
+        info['gpu_card'] = self.format_gpu_card(info['gpu_devices'][0]) if info['gpu_devices'] else None
+        
+        return info
+    
+    def _collect_network(self):
+        """Collect network interfaces and traffic statistics"""
+        info = {}
+        
         # Comprehensive Network Information
-        self.progress_update.emit("Analyzing network interfaces...", 80)
-        time.sleep(0.3)
         info['network_interfaces'] = []
         info['network_stats'] = {}
         try:
@@ -280,7 +549,8 @@ class SystemInfoWorker(QThread):
             
             for name, addresses in interfaces.items():
                 # Skip loopback and virtual interfaces
-                if name.lower() in ['lo', 'loopback'] or 'virtual' in name.lower():
+                lname = name.lower()
+                if lname in _SKIP_INTERFACES or 'virtual' in lname:
                     continue
                 
                 if name in stats:
@@ -294,24 +564,30 @@ class SystemInfoWorker(QThread):
                     
                     # Get all addresses (IPv4, IPv6, MAC)
                     for addr in addresses:
-                        if hasattr(addr, 'family'):
-                            family_str = str(addr.family)
-                            if 'AF_INET' in family_str and not addr.address.startswith('127.'):
-                                interface_info['addresses'].append({
-                                    'type': 'IPv4',
-                                    'address': addr.address,
-                                    'netmask': addr.netmask,
-                                    'broadcast': getattr(addr, 'broadcast', None)
-                                })
-                            elif 'AF_LINK' in family_str or 'AF_PACKET' in family_str:
-                                interface_info['mac_address'] = addr.address
+                        family = addr.family
+                        if family == _AF_INET and not addr.address.startswith('127.'):
+                            interface_info['addresses'].append({
+                                'type': 'IPv4',
+                                'address': addr.address,
+                                'netmask': addr.netmask,
+                                'broadcast': addr.broadcast
+                            })
+                        elif family == _AF_INET6:
+                            interface_info['addresses'].append({
+                                'type': 'IPv6',
+                                'address': addr.address,
+                                'netmask': addr.netmask,
+                                'broadcast': addr.broadcast
+                            })
+                        elif family == _AF_LINK:
+                            interface_info['mac_address'] = addr.address
                     
                     # Add I/O statistics
                     if name in io_counters:
                         io = io_counters[name]
                         interface_info['io_stats'] = {
-                            'bytes_sent': io.bytes_sent / (1024**2),  # MB
-                            'bytes_recv': io.bytes_recv / (1024**2),  # MB
+                            'bytes_sent': io.bytes_sent * _MB,  # MB
+                            'bytes_recv': io.bytes_recv * _MB,  # MB
                             'packets_sent': io.packets_sent,
                             'packets_recv': io.packets_recv,
                             'errors_in': io.errin,
@@ -323,21 +599,28 @@ class SystemInfoWorker(QThread):
                     if interface_info['addresses']:
                         info['network_interfaces'].append(interface_info)
             
-            # Overall network statistics
-            net_io = psutil.net_io_counters()
-            if net_io:
+            # Overall network statistics, summed over every NIC (loopback
+            # included) exactly like psutil.net_io_counters() without pernic
+            if io_counters:
+                nics = io_counters.values()
                 info['network_stats'] = {
-                    'total_bytes_sent': net_io.bytes_sent / (1024**3),  # GB
-                    'total_bytes_recv': net_io.bytes_recv / (1024**3),  # GB
-                    'total_packets_sent': net_io.packets_sent,
-                    'total_packets_recv': net_io.packets_recv
+                    'total_bytes_sent': sum(io.bytes_sent for io in nics) * _GB,  # GB
+                    'total_bytes_recv': sum(io.bytes_recv for io in nics) * _GB,  # GB
+                    'total_packets_sent': sum(io.packets_sent for io in nics),
+                    'total_packets_recv': sum(io.packets_recv for io in nics)
                 }
-        except:
+        except _PROBE_ERRORS:
             pass
         
+        info['network_items'] = self.format_network_items(info['network_interfaces'])
+        
+        return info
+    
+    def _collect_sensors(self):
+        """Collect battery, temperature and fan readings"""
+        info = {}
+        
         # Battery and Power Information
-        self.progress_update.emit("Checking power management...", 85)
-        time.sleep(0.2)
         try:
             battery = psutil.sensors_battery()
             if battery:
@@ -353,12 +636,22 @@ class SystemInfoWorker(QThread):
                     'time_left': time_left,
                     'time_left_seconds': battery.secsleft if battery.secsleft != psutil.POWER_TIME_UNLIMITED else None
                 }
-        except:
+                
+                battery_status = "🔌 Charging" if battery.power_plugged else "🔋 On Battery"
+                info['battery_subtitle'] = battery_status
+                if time_left:
+                    info['battery_subtitle'] += f" • {time_left} remaining"
+        except _PROBE_ERRORS:
             info['battery'] = None
         
+        # Linux exposes temperatures and fans under the same hwmon devices, so
+        # read both in one directory walk instead of two psutil scans
+        hwmon = self.read_hwmon_sensors() if platform.system() == "Linux" else None
+        if hwmon:
+            info['temperatures'], info['fans'] = hwmon
+            return info
+        
         # Temperature and Sensor Information
-        self.progress_update.emit("Reading sensor data...", 90)
-        time.sleep(0.2)
         try:
             temps = psutil.sensors_temperatures()
             info['temperatures'] = {}
@@ -372,7 +665,7 @@ class SystemInfoWorker(QThread):
                             'high': sensor.high,
                             'critical': sensor.critical
                         })
-        except:
+        except _PROBE_ERRORS:
             info['temperatures'] = {}
         
         # Fan Information
@@ -387,38 +680,245 @@ class SystemInfoWorker(QThread):
                             'label': fan.label or fan_name,
                             'current': fan.current
                         })
-        except:
+        except _PROBE_ERRORS:
             info['fans'] = {}
         
+        return info
+    
+    def read_hwmon_sensors(self):
+        """Read temperatures and fan speeds from /sys/class/hwmon in a single pass"""
+        def read_value(path):
+            try:
+                with open(path) as f:
+                    return f.read().strip()
+            except (OSError, ValueError):
+                return None
+        
+        def read_number(path, scale=1):
+            try:
+                return float(read_value(path)) / scale
+            except (TypeError, ValueError):
+                return None
+        
+        try:
+            device_paths = sorted(entry.path for entry in os.scandir('/sys/class/hwmon'))
+        except OSError:
+            return None
+        
+        temperatures = {}
+        fans = {}
+        for device_path in device_paths:
+            # Some drivers keep their sensor files under device/
+            for base in (device_path, os.path.join(device_path, 'device')):
+                try:
+                    files = set(os.listdir(base))
+                except OSError:
+                    continue
+                
+                inputs = sorted(f for f in files if f.endswith('_input') and f.startswith(('temp', 'fan')))
+                if not inputs:
+                    continue
+                
+                name = read_value(os.path.join(device_path, 'name')) or os.path.basename(device_path)
+                for filename in inputs:
+                    prefix = filename[:-len('_input')]  # e.g. temp1, fan2
+                    current = read_number(os.path.join(base, filename), 1000 if prefix.startswith('temp') else 1)
+                    if current is None:
+                        continue
+                    
+                    label = None
+                    if f"{prefix}_label" in files:
+                        label = read_value(os.path.join(base, f"{prefix}_label"))
+                    
+                    if prefix.startswith('temp'):
+                        temperatures.setdefault(name, []).append({
+                            'label': label or name,
+                            'current': current,
+                            'high': read_number(os.path.join(base, f"{prefix}_max"), 1000) if f"{prefix}_max" in files else None,
+                            'critical': read_number(os.path.join(base, f"{prefix}_crit"), 1000) if f"{prefix}_crit" in files else None
+                        })
+                    else:
+                        fans.setdefault(name, []).append({
+                            'label': label or name,
+                            'current': int(current)
+                        })
+                break
+        
+        if not temperatures and not fans:
+            return None
+        return temperatures, fans
+    
+    def _collect_processes(self):
+        """Collect process counts and load average"""
+        info = {}
+        
         # Process Information
-        self.progress_update.emit("Counting system processes...", 95)
-        time.sleep(0.2)
         try:
-            info['process_count'] = len(psutil.pids())
-            info['process_running'] = len([p for p in psutil.process_iter(['status']) if p.info['status'] == psutil.STATUS_RUNNING])
-            info['process_sleeping'] = len([p for p in psutil.process_iter(['status']) if p.info['status'] == psutil.STATUS_SLEEPING])
-        except:
+            # Single pass over the process table, tallying statuses
+            status_counts = Counter()
+            for p in psutil.process_iter(['status']):
+                status_counts[p.info['status']] += 1
+            info['process_count'] = sum(status_counts.values())
+            info['process_running'] = status_counts.get(psutil.STATUS_RUNNING, 0)
+            info['process_sleeping'] = status_counts.get(psutil.STATUS_SLEEPING, 0)
+        except _PROBE_ERRORS:
             info['process_count'] = 0
             info['process_running'] = 0
             info['process_sleeping'] = 0
         
         # Load Average (Unix-like systems)
         try:
-            if hasattr(psutil, 'getloadavg'):
+            if _HAS_GETLOADAVG:
                 load_avg = psutil.getloadavg()
                 info['load_average'] = {
                     '1min': round(load_avg[0], 2),
                     '5min': round(load_avg[1], 2),
                     '15min': round(load_avg[2], 2)
                 }
-        except:
+        except _PROBE_ERRORS:
             info['load_average'] = None
         
-        self.progress_update.emit("Finalizing system analysis...", 100)
-        time.sleep(0.3)
-        
         return info
     
+    def format_storage_items(self, devices, capabilities):
+        """Format storage rows for the storage detail card"""
+        items = []
+        
+        for device in devices[:4]:
+            device_name = device['device']
+            if platform.system() == "Windows":
+                device_name = f"Drive {device['device']}"
+            
+            details = f"{device['used_gb']:.0f} GB used • {device['fstype']}"
+            if device.get('io_stats'):
+                io = device['io_stats']
+                details += f" • R: {io['read_bytes']:.1f} GB W: {io['write_bytes']:.1f} GB"
+            
+            items.append({
+                'name': f"{device_name} ({device['total_gb']:.0f} GB)",
+                'details': details,
+                'progress': device['percent']
+            })
+        
+        # Add capabilities info
+        if capabilities:
+            items.append({
+                'name': f"Max Capacity: {capabilities.get('max_capacity', 'Unknown')}",
+                'details': f"Interfaces: {', '.join(capabilities.get('interface_types', [])[:2])}"
+            })
+        
+        return items
+    
+    def format_network_items(self, interfaces):
+        """Format interface rows for the network detail card"""
+        items = []
+        
+        for interface in interfaces[:4]:
+            status = "🟢 Connected" if interface['is_up'] else "🔴 Disconnected"
+            ip_addr = interface['addresses'][0]['address'] if interface['addresses'] else "No IP"
+            
+            details = f"{status} • {ip_addr}"
+            
+            if interface['speed'] > 0:
+                if interface['speed'] >= 1000:
+                    details += f" • {interface['speed']//1000} Gbps"
+                else:
+                    details += f" • {interface['speed']} Mbps"
+            
+            if interface.get('io_stats'):
+                io = interface['io_stats']
+                details += f" • ↑{io['bytes_sent']:.0f} MB ↓{io['bytes_recv']:.0f} MB"
+            
+            items.append({
+                'name': interface['name'],
+                'details': details
+            })
+        
+        return items
+    
+    def format_gpu_card(self, gpu):
+        """Format the name, subtitle, load and details shown on the graphics card"""
+        card = {'name': _ellipsize(gpu['name'], 25), 'subtitle': "", 'progress': None, 'details': []}
+        
+        if 'memory_total' in gpu:
+            card['subtitle'] = f"{gpu['memory_total']} MB VRAM"
+            if 'load' in gpu:
+                card['progress'] = gpu['load']
+                card['subtitle'] += f" • {gpu['load']:.0f}% load"
+            
+            card['details'].append(f"Memory Used: {gpu.get('memory_used', 0)} MB")
+            card['details'].append(f"Memory Free: {gpu.get('memory_free', 0)} MB")
+            
+            if gpu.get('temperature'):
+                card['details'].append(f"Temperature: {gpu['temperature']:.0f}°C")
+        
+        return card
+    
+    def get_cpu_usage(self):
+        """Get overall and per-core CPU usage without blocking"""
+        now = time.monotonic()
+        cls = SystemInfoWorker
+        if cls._cpu_sample is None:
+            # A sample taken right after priming measures a few milliseconds
+            # and reads as 0 or 100% noise
+            remaining = cls._cpu_primed_time + cls.CPU_PRIME_MIN_AGE - now
+            if remaining > 0:
+                time.sleep(remaining)
+                now = time.monotonic()
+        if cls._cpu_sample is None or now - cls._cpu_sample_time >= cls.CPU_SAMPLE_MIN_INTERVAL:
+            cls._cpu_sample = (
+                psutil.cpu_percent(interval=None),
+                psutil.cpu_percent(interval=None, percpu=True)
+            )
+            cls._cpu_sample_time = now
+        return cls._cpu_sample
+    
+    def start_commands(self, commands):
+        """Start shellouts in the background without waiting for them"""
+        for args in commands:
+            if args in self._unavailable_commands:
+                continue
+            try:
+                self._commands[args] = subprocess.Popen(
+                    args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+                )
+            except OSError:
+                self._unavailable_commands.add(args)
+    
+    def command_output(self, args):
+        """Return the stdout of a shellout, or None if it failed or timed out"""
+        process = self._commands.pop(args, None)
+        timeout = max(0, self._commands_deadline - time.monotonic())
+        if process is None:
+            if args in self._unavailable_commands:
+                return None
+            
+            # Not started up front; run it now with its own timeout
+            self.start_commands([args])
+            process = self._commands.pop(args, None)
+            timeout = self.COMMAND_TIMEOUT
+            if process is None:
+                return None
+        
+        try:
+            stdout, _ = process.communicate(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            return None
+        
+        return stdout if process.returncode == 0 else None
+    
+    def stop_commands(self):
+        """Reap shellouts whose output was never requested"""
+        while self._commands:
+            _, process = self._commands.popitem()
+            try:
+                process.kill()
+                process.communicate()
+            except OSError:
+                pass
+    
     def get_motherboard_info(self):
         """Get motherboard information"""
         motherboard_info = {
@@ -430,33 +930,34 @@ class SystemInfoWorker(QThread):
         
         try:
             if platform.system() == "Windows":
-                # Try WMI for motherboard info
+                hardware = self.get_wmi_hardware_info()
+                if hardware is not None:
+                    motherboard_info.update(hardware['board'])
+                    return motherboard_info
+                
+                # Fall back to wmic for motherboard info
                 try:
-                    result = subprocess.run([
-                        'wmic', 'baseboard', 'get', 'manufacturer,product,version,serialnumber', '/format:csv'
-                    ], capture_output=True, text=True, timeout=10)
-                    
-                    if result.returncode == 0:
-                        lines = result.stdout.strip().split('\n')
-                        for line in lines[1:]:  # Skip header
-                            if line.strip() and ',' in line:
-                                parts = line.split(',')
-                                if len(parts) >= 5:
-                                    motherboard_info['manufacturer'] = parts[1].strip() or 'Unknown'
-                                    motherboard_info['product'] = parts[2].strip() or 'Unknown'
-                                    motherboard_info['serial'] = parts[3].strip() or 'Unknown'
-                                    motherboard_info['version'] = parts[4].strip() or 'Unknown'
-                                    break
-                except:
+                    output = self.command_output(self.MOTHERBOARD_COMMANDS["Windows"])
+                    if output is not None:
+                        # Fields are quoted when a value contains a comma
+                        reader = csv.reader(io.StringIO(output.strip()))
+                        next(reader, None)  # Skip header
+                        for parts in reader:
+                            if len(parts) >= 5:
+                                motherboard_info['manufacturer'] = parts[1].strip() or 'Unknown'
+                                motherboard_info['product'] = parts[2].strip() or 'Unknown'
+                                motherboard_info['serial'] = parts[3].strip() or 'Unknown'
+                                motherboard_info['version'] = parts[4].strip() or 'Unknown'
+                                break
+                except _PROBE_ERRORS + (csv.Error,):
                     pass
             
             elif platform.system() == "Linux":
                 # Try DMI decode for motherboard info
                 try:
-                    result = subprocess.run(['dmidecode', '-t', 'baseboard'], 
-                                          capture_output=True, text=True, timeout=10)
-                    if result.returncode == 0:
-                        lines = result.stdout.split('\n')
+                    output = self.command_output(self.MOTHERBOARD_COMMANDS["Linux"])
+                    if output is not None:
+                        lines = output.split('\n')
                         for line in lines:
                             line = line.strip()
                             if 'Manufacturer:' in line:
@@ -465,9 +966,9 @@ class SystemInfoWorker(QThread):
                                 motherboard_info['product'] = line.split(':', 1)[1].strip()
                             elif 'Version:' in line:
                                 motherboard_info['version'] = line.split(':', 1)[1].strip()
-                except:
+                except _PROBE_ERRORS:
                     pass
-        except:
+        except _PROBE_ERRORS:
             pass
         
         return motherboard_info
@@ -516,7 +1017,7 @@ class SystemInfoWorker(QThread):
             elif 'amd' in cpu_vendor.lower():
                 if current_ram_gb >= 16:
                     capabilities['memory_type'] = 'DDR4/DDR5 (AMD)'
-        except:
+        except _PROBE_ERRORS:
             pass
         
         return capabilities
@@ -547,35 +1048,85 @@ class SystemInfoWorker(QThread):
                 capabilities['max_capacity'] = '64+ TB'
                 capabilities['interface_types'] = ['SATA III', 'M.2 NVMe', 'PCIe 5.0', 'U.2', 'Enterprise SAS']
                 capabilities['max_drives'] = '8+ drives'
-        except:
+        except _PROBE_ERRORS:
             pass
         
         return capabilities
     
+    def get_wmi_hardware_info(self):
+        """Query baseboard and video controllers through one shared WMI session"""
+        wmi = _optional_module('wmi')
+        pythoncom = _optional_module('pythoncom')
+        if wmi is None or pythoncom is None:
+            return None
+        
+        # The motherboard and GPU sections run on different threads; the
+        # first one to get here opens the session and queries both classes
+        with self._wmi_lock:
+            if not self._wmi_queried:
+                self._wmi_queried = True
+                try:
+                    pythoncom.CoInitialize()
+                    try:
+                        connection = wmi.WMI()
+                        board = {
+                            'manufacturer': 'Unknown',
+                            'product': 'Unknown',
+                            'version': 'Unknown',
+                            'serial': 'Unknown'
+                        }
+                        for baseboard in connection.Win32_BaseBoard():
+                            board['manufacturer'] = (baseboard.Manufacturer or '').strip() or 'Unknown'
+                            board['product'] = (baseboard.Product or '').strip() or 'Unknown'
+                            board['version'] = (baseboard.Version or '').strip() or 'Unknown'
+                            board['serial'] = (baseboard.SerialNumber or '').strip() or 'Unknown'
+                            break
+                        
+                        self._wmi_hardware = {
+                            'board': board,
+                            'gpus': [(controller.Name or '').strip() for controller in connection.Win32_VideoController()]
+                        }
+                    finally:
+                        pythoncom.CoUninitialize()
+                except Exception:  # COM and WMI errors do not derive from OSError
+                    self._wmi_hardware = None
+        
+        return self._wmi_hardware
+    
     def get_gpu_info(self):
-        """Get GPU information using system commands"""
+        """Get the GPU name using system commands, probing only once per session"""
+        if not SystemInfoWorker._gpu_name_probed:
+            SystemInfoWorker._gpu_name = self.probe_gpu_name()
+            SystemInfoWorker._gpu_name_probed = True
+        return SystemInfoWorker._gpu_name
+    
+    def probe_gpu_name(self):
+        """Probe the GPU name with WMI, wmic or lspci"""
         try:
             if platform.system() == "Windows":
-                result = subprocess.run(
-                    ['wmic', 'path', 'win32_VideoController', 'get', 'name'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    lines = result.stdout.strip().split('\n')
-                    for line in lines:
+                hardware = self.get_wmi_hardware_info()
+                if hardware is not None:
+                    for name in hardware['gpus']:
+                        if name and 'Microsoft' not in name:
+                            return name
+                    return None
+                
+                output = self.command_output(self.GPU_COMMANDS["Windows"])
+                if output is not None:
+                    for line in output.splitlines():
                         line = line.strip()
                         if line and line != 'Name' and 'Microsoft' not in line:
                             return line
             
             elif platform.system() == "Linux":
-                result = subprocess.run(['lspci'], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
+                output = self.command_output(self.GPU_COMMANDS["Linux"])
+                if output is not None:
+                    for line in output.split('\n'):
                         if 'VGA' in line or 'Display' in line:
                             parts = line.split(': ')
                             if len(parts) > 1:
                                 return parts[1].split(' (')[0]
-        except:
+        except _PROBE_ERRORS:
             pass
         
         return None
@@ -602,38 +1153,19 @@ class LoadingWidget(QWidget):
         # Main loading icon/text
         loading_label = QLabel("🔍")
         loading_label.setAlignment(Qt.AlignCenter)
-        loading_label.setStyleSheet("""
-            QLabel {
-                color: #0066cc;
-                font-size: 48px;
-                border: none;
-            }
-        """)
+        loading_label.setObjectName("loadingIcon")
         layout.addWidget(loading_label)
         
         # Loading title
         self.title_label = QLabel("Gathering Information")
         self.title_label.setAlignment(Qt.AlignCenter)
-        self.title_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: 600;
-                border: none;
-            }
-        """)
+        self.title_label.setObjectName("loadingTitle")
         layout.addWidget(self.title_label)
         
         # Status message
         self.status_label = QLabel("Initializing system scan...")
         self.status_label.setAlignment(Qt.AlignCenter)
-        self.status_label.setStyleSheet("""
-            QLabel {
-                color: #b0b0b0;
-                font-size: 14px;
-                border: none;
-            }
-        """)
+        self.status_label.setObjectName("loadingStatus")
         layout.addWidget(self.status_label)
         
         # Progress bar
@@ -643,18 +1175,7 @@ class LoadingWidget(QWidget):
         self.progress_bar.setTextVisible(False)
         self.progress_bar.setFixedHeight(6)
         self.progress_bar.setFixedWidth(300)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: none;
-                border-radius: 3px;
-                background-color: #444;
-            }
-            QProgressBar::chunk {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
-                           stop:0 #0066cc, stop:1 #0052a3);
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setObjectName("loadingProgress")
         
         progress_container = QWidget()
         progress_layout = QHBoxLayout()
@@ -667,13 +1188,7 @@ class LoadingWidget(QWidget):
         # Percentage label
         self.percentage_label = QLabel("0%")
         self.percentage_label.setAlignment(Qt.AlignCenter)
-        self.percentage_label.setStyleSheet("""
-            QLabel {
-                color: #888;
-                font-size: 12px;
-                border: none;
-            }
-        """)
+        self.percentage_label.setObjectName("loadingPercent")
         layout.addWidget(self.percentage_label)
         
         self.setLayout(layout)
@@ -690,68 +1205,246 @@ class LoadingWidget(QWidget):
         self.progress_bar.setValue(percentage)
         self.percentage_label.setText(f"{percentage}%")
 
+# Application-wide style sheet, parsed once by QApplication. Cards and their
+# parts are matched by object name; the base QWidget rule used to live on
+# the central widget, but inherited widget style sheets outrank the
+# application's, so it is kept here where specificity decides instead
+_APP_QSS = """
+    QWidget {
+        background-color: #1a1a1a;
+        border-radius: 12px;
+    }
+    QMainWindow {
+        background-color: #0f0f0f;
+        border-radius: 0;
+    }
+    QLabel#loadingIcon {
+        color: #0066cc;
+        font-size: 48px;
+        border: none;
+    }
+    QLabel#loadingTitle {
+        color: #ffffff;
+        font-size: 24px;
+        font-weight: 600;
+        border: none;
+    }
+    QLabel#loadingStatus {
+        color: #b0b0b0;
+        font-size: 14px;
+        border: none;
+    }
+    QLabel#loadingPercent {
+        color: #888;
+        font-size: 12px;
+        border: none;
+    }
+    QProgressBar#loadingProgress {
+        border: none;
+        border-radius: 3px;
+        background-color: #444;
+    }
+    QProgressBar#loadingProgress::chunk {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0, 
+                   stop:0 #0066cc, stop:1 #0052a3);
+        border-radius: 3px;
+    }
+    QLabel#sectionTitle {
+        color: #ffffff;
+        font-size: 18px;
+        font-weight: 600;
+        margin: 8px 0;
+        border: none;
+    }
+    QFrame#card {
+        background-color: #2a2a2a;
+        border: 1px solid #333;
+        border-radius: 8px;
+    }
+    QLabel#cardTitle {
+        color: #888;
+        background-color: transparent;
+        font-size: 11px;
+        font-weight: 500;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+        border: none;
+    }
+    QLabel#cardValue {
+        color: #ffffff;
+        background-color: transparent;
+        font-size: 14px;
+        font-weight: 600;
+        border: none;
+    }
+    QLabel#cardSubtitle {
+        color: #b0b0b0;
+        background-color: transparent;
+        font-size: 12px;
+        border: none;
+    }
+    QLabel#cardDetail {
+        color: #888;
+        background-color: transparent;
+        font-size: 10px;
+        padding: 2px 0;
+        border: none;
+    }
+    QLabel#itemName {
+        color: #ffffff;
+        background-color: transparent;
+        font-size: 12px;
+        font-weight: 500;
+        border: none;
+    }
+    QLabel#itemDetails {
+        color: #b0b0b0;
+        background-color: transparent;
+        font-size: 11px;
+        border: none;
+    }
+    QProgressBar#cardProgress {
+        border: none;
+        border-radius: 2px;
+        background-color: #444;
+    }
+    QProgressBar#cardProgress::chunk {
+        background-color: #0066cc;
+        border-radius: 2px;
+        border: none;
+    }
+    QProgressBar#detailProgress {
+        border: none;
+        border-radius: 1px;
+        background-color: #444;
+        margin: 2px 0;
+    }
+    QProgressBar#detailProgress::chunk {
+        background-color: #0066cc;
+        border-radius: 1px;
+        border: none;
+    }
+"""
+
+# Colours used programmatically by the widgets and the application palette,
+# shared instead of rebuilt per instance
+COLOR_BG_WINDOW = QColor(15, 15, 15)
+COLOR_BG_BASE = QColor(26, 26, 26)
+COLOR_TEXT = QColor(255, 255, 255)
+COLOR_ACCENT = QColor("#0066cc")
+COLOR_ACCENT_HOVER = COLOR_ACCENT.lighter(120)
+COLOR_BG_CARD = QColor(42, 42, 42)
+COLOR_BG_HOVER = QColor(51, 51, 51)
+
 class MiniGraph(QWidget):
     """Mini graph widget for displaying usage data with hover effect"""
     
     def __init__(self, data, color="#0066cc", max_value=100):
         super().__init__()
-        self.data = data if isinstance(data, list) else [data]
-        self.color = QColor(color)
-        self.hover_color = QColor(color).lighter(120)
+        if color == "#0066cc":
+            self.color = COLOR_ACCENT
+            self.hover_color = COLOR_ACCENT_HOVER
+        else:
+            self.color = QColor(color)
+            self.hover_color = self.color.lighter(120)
         self.max_value = max_value
+        self._rects = []
         self.setFixedHeight(30)
         self.setMinimumWidth(60)
         self.is_hovered = False
         
+        # Rendered bars, rebuilt only when the size changes
+        self._pix_normal = None
+        self._pix_hover = None
+        self._cached_size = None
+        
         # Enable hover tracking
         self.setMouseTracking(True)
         
-        # Graph has hover effect
-        self.setStyleSheet("""
-            QWidget:hover {
-                background-color: #333;
-                border-radius: 4px;
-            }
-        """)
+        # Hover repaints are coalesced to at most one per frame
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self.update)
+        
+        # The graph paints every pixel itself, hover background included, so
+        # Qt can skip clearing the background first
+        self.setAttribute(Qt.WA_OpaquePaintEvent, True)
+        self.setAttribute(Qt.WA_NoSystemBackground, True)
+        
+        self.set_data(data)
+    
+    def set_data(self, data):
+        """Replace the graph data and drop the rendered bars"""
+        self.data = data if isinstance(data, list) else [data]
+        self._n = len(self.data)
+        self._inv_max = 1.0 / float(self.max_value) if self.max_value else 0.0
+        if len(self._rects) != self._n:
+            self._rects = [QRect() for _ in range(self._n)]
+        self._pix_normal = None
+        self._pix_hover = None
+        self.update()
     
     def enterEvent(self, event):
         self.is_hovered = True
-        self.update()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
     
     def leaveEvent(self, event):
         self.is_hovered = False
-        self.update()
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+    
+    def resizeEvent(self, event):
+        self._cached_size = None
+        super().resizeEvent(event)
     
     def paintEvent(self, event):
+        if not self._n:
+            QPainter(self).fillRect(self.rect(), COLOR_BG_CARD)
+            return
+        
+        if self._pix_normal is None or self._cached_size != self.size():
+            self._layout_bars()
+            self._pix_normal = self._render_pixmap(False)
+            self._pix_hover = self._render_pixmap(True)
+            self._cached_size = self.size()
+        
         painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pix_hover if self.is_hovered else self._pix_normal)
+    
+    def _layout_bars(self):
+        """Position the bar rects for the current data and size"""
+        width = self.width()
+        full_height = self.height()
+        scale = self._inv_max * full_height
+        
+        # A single value fills the whole width
+        bar_width = width / self._n
+        for i, (bar_rect, value) in enumerate(zip(self._rects, self.data)):
+            height = int(value * scale)
+            bar_rect.setRect(int(i * bar_width), full_height - height, 
+                             int(bar_width), height)
+    
+    def _render_pixmap(self, hover):
+        """Render the laid out bars into a pixmap"""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        
+        # Draw background
+        pixmap.fill(COLOR_BG_HOVER if hover else COLOR_BG_CARD)
+        
+        painter = QPainter(pixmap)
         painter.setRenderHint(QPainter.Antialiasing)
         
-        rect = self.rect()
-        if not self.data or len(self.data) == 0:
-            return
+        # Draw graph; all bars go to the painter in one call
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.hover_color if hover else self.color)
+        painter.drawRects(self._rects)
         
-        # Draw background
-        bg_color = QColor(42, 42, 42)
-        if self.is_hovered:
-            bg_color = QColor(51, 51, 51)
-        painter.fillRect(rect, bg_color)
-        
-        # Draw graph
-        graph_color = self.hover_color if self.is_hovered else self.color
-        
-        if len(self.data) == 1:
-            # Single bar
-            height = (self.data[0] / self.max_value) * rect.height()
-            bar_rect = QRect(0, rect.height() - int(height), rect.width(), int(height))
-            painter.fillRect(bar_rect, graph_color)
-        else:
-            # Multiple bars or line
-            bar_width = rect.width() / len(self.data)
-            for i, value in enumerate(self.data):
-                height = (value / self.max_value) * rect.height()
-                bar_rect = QRect(int(i * bar_width), rect.height() - int(height), 
-                               int(bar_width), int(height))
-                painter.fillRect(bar_rect, graph_color)
+        painter.end()
+        return pixmap
 
 class CleanCard(QFrame):
     """Clean card with no hover effects and selectable text"""
@@ -760,13 +1453,7 @@ class CleanCard(QFrame):
         super().__init__()
         
         # No hover effects - static styling
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #333;
-                border-radius: 8px;
-            }
-        """)
+        self.setObjectName("card")
         
         if wide:
             self.setMinimumHeight(140)
@@ -782,85 +1469,89 @@ class CleanCard(QFrame):
         header_layout.setContentsMargins(0, 0, 0, 0)
         
         # Title - selectable text
-        title_label = QLabel(title)
-        title_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        title_label.setStyleSheet("""
-            color: #888;
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border: none;
-        """)
-        header_layout.addWidget(title_label)
+        self.title_label = QLabel()
+        self.title_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.title_label.setObjectName("cardTitle")
+        header_layout.addWidget(self.title_label)
         
-        # Add graph if provided
-        if graph_data:
-            graph = MiniGraph(graph_data)
-            header_layout.addWidget(graph)
+        # Graph, shown only when data is provided
+        self.graph = MiniGraph([])
+        header_layout.addWidget(self.graph)
         
         layout.addLayout(header_layout)
         
         # Value - selectable text
-        value_label = QLabel(value)
-        value_label.setWordWrap(True)
-        value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        value_label.setStyleSheet("""
-            color: #ffffff;
-            font-size: 14px;
-            font-weight: 600;
-            border: none;
-        """)
-        layout.addWidget(value_label)
+        self.value_label = QLabel()
+        self.value_label.setWordWrap(True)
+        self.value_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.value_label.setObjectName("cardValue")
+        layout.addWidget(self.value_label)
         
         # Subtitle - selectable text
-        if subtitle:
-            subtitle_label = QLabel(subtitle)
-            subtitle_label.setWordWrap(True)
-            subtitle_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            subtitle_label.setStyleSheet("""
-                color: #b0b0b0;
-                font-size: 12px;
-                border: none;
-            """)
-            layout.addWidget(subtitle_label)
+        self.subtitle_label = QLabel()
+        self.subtitle_label.setWordWrap(True)
+        self.subtitle_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+        self.subtitle_label.setObjectName("cardSubtitle")
+        layout.addWidget(self.subtitle_label)
         
         # Progress bar - no hover effect
-        if progress is not None:
-            progress_bar = QProgressBar()
-            progress_bar.setMaximum(100)
-            progress_bar.setValue(int(progress))
-            progress_bar.setTextVisible(False)
-            progress_bar.setFixedHeight(4)
-            progress_bar.setStyleSheet("""
-                QProgressBar {
-                    border: none;
-                    border-radius: 2px;
-                    background-color: #444;
-                }
-                QProgressBar::chunk {
-                    background-color: #0066cc;
-                    border-radius: 2px;
-                    border: none;
-                }
-            """)
-            layout.addWidget(progress_bar)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setMaximum(100)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedHeight(4)
+        self.progress_bar.setObjectName("cardProgress")
+        layout.addWidget(self.progress_bar)
         
         # Details list - selectable text
-        if details:
-            for detail in details[:3]:  # Limit to 3 items
-                detail_label = QLabel(detail)
-                detail_label.setWordWrap(True)
-                detail_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                detail_label.setStyleSheet("""
-                    color: #888;
-                    font-size: 10px;
-                    padding: 2px 0;
-                    border: none;
-                """)
-                layout.addWidget(detail_label)
+        self.detail_labels = []
+        for _ in range(3):  # Limit to 3 items
+            detail_label = QLabel()
+            detail_label.setWordWrap(True)
+            detail_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            detail_label.setObjectName("cardDetail")
+            layout.addWidget(detail_label)
+            self.detail_labels.append(detail_label)
         
         self.setLayout(layout)
+        self.set_content(title, value, subtitle, progress, details, graph_data)
+    
+    def set_content(self, title, value, subtitle="", progress=None, details=None, graph_data=None):
+        """Update the whole card in place, hiding the parts that are not provided"""
+        self.title_label.setText(title)
+        self.set_value(value)
+        self.set_subtitle(subtitle)
+        self.set_progress(progress)
+        self.set_details(details)
+        self.set_graph(graph_data)
+    
+    def set_value(self, value):
+        """Set the main value text"""
+        self.value_label.setText(value)
+    
+    def set_subtitle(self, subtitle):
+        """Set the subtitle, hiding it when empty"""
+        self.subtitle_label.setText(subtitle)
+        self.subtitle_label.setVisible(bool(subtitle))
+    
+    def set_progress(self, progress):
+        """Set the progress bar value, hiding it when None"""
+        if progress is not None:
+            self.progress_bar.setValue(int(progress))
+        self.progress_bar.setVisible(progress is not None)
+    
+    def set_details(self, details):
+        """Set up to 3 detail lines, hiding the unused ones"""
+        details = details[:3] if details else []
+        for i, detail_label in enumerate(self.detail_labels):
+            if i < len(details):
+                detail_label.setText(details[i])
+            detail_label.setVisible(i < len(details))
+    
+    def set_graph(self, graph_data):
+        """Set the mini graph data, hiding the graph when empty"""
+        if graph_data:
+            self.graph.set_data(graph_data)
+        self.graph.setVisible(bool(graph_data))
 
 class DetailCard(QFrame):
     """Detailed card with selectable text and no hover effects"""
@@ -869,13 +1560,7 @@ class DetailCard(QFrame):
         super().__init__()
         
         # No hover effects
-        self.setStyleSheet("""
-            QFrame {
-                background-color: #2a2a2a;
-                border: 1px solid #333;
-                border-radius: 8px;
-            }
-        """)
+        self.setObjectName("card")
         
         self.setMinimumHeight(120)
         
@@ -886,151 +1571,191 @@ class DetailCard(QFrame):
         # Title - selectable text
         title_label = QLabel(title)
         title_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        title_label.setStyleSheet("""
-            color: #888;
-            font-size: 11px;
-            font-weight: 500;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            border: none;
-        """)
+        title_label.setObjectName("cardTitle")
         layout.addWidget(title_label)
         
-        # Items
-        for item in items[:4]:  # Limit to 4 items
+        # Item rows, shown as needed by set_items
+        self.rows = []
+        for _ in range(4):  # Limit to 4 items
             item_layout = QHBoxLayout()
             item_layout.setContentsMargins(0, 0, 0, 0)
             
             # Name - selectable text
-            name_label = QLabel(item.get('name', ''))
+            name_label = QLabel()
             name_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-            name_label.setStyleSheet("""
-                color: #ffffff;
-                font-size: 12px;
-                font-weight: 500;
-                border: none;
-            """)
+            name_label.setObjectName("itemName")
             item_layout.addWidget(name_label)
             
             # Details - selectable text
-            if 'details' in item:
-                details_label = QLabel(item['details'])
-                details_label.setAlignment(Qt.AlignRight)
-                details_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-                details_label.setStyleSheet("""
-                    color: #b0b0b0;
-                    font-size: 11px;
-                    border: none;
-                """)
-                item_layout.addWidget(details_label)
+            details_label = QLabel()
+            details_label.setAlignment(Qt.AlignRight)
+            details_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
+            details_label.setObjectName("itemDetails")
+            item_layout.addWidget(details_label)
             
             layout.addLayout(item_layout)
             
             # Progress bar for items with progress - no hover effect
-            if 'progress' in item:
-                progress_bar = QProgressBar()
-                progress_bar.setMaximum(100)
-                progress_bar.setValue(int(item['progress']))
-                progress_bar.setTextVisible(False)
-                progress_bar.setFixedHeight(3)
-                progress_bar.setStyleSheet("""
-                    QProgressBar {
-                        border: none;
-                        border-radius: 1px;
-                        background-color: #444;
-                        margin: 2px 0;
-                    }
-                    QProgressBar::chunk {
-                        background-color: #0066cc;
-                        border-radius: 1px;
-                        border: none;
-                    }
-                """)
-                layout.addWidget(progress_bar)
+            progress_bar = QProgressBar()
+            progress_bar.setMaximum(100)
+            progress_bar.setTextVisible(False)
+            progress_bar.setFixedHeight(3)
+            progress_bar.setObjectName("detailProgress")
+            layout.addWidget(progress_bar)
+            
+            self.rows.append((name_label, details_label, progress_bar))
         
         self.setLayout(layout)
+        self.set_items(items)
+    
+    def set_items(self, items):
+        """Update the rows in place, hiding the ones not needed"""
+        items = items[:4]
+        for i, (name_label, details_label, progress_bar) in enumerate(self.rows):
+            item = items[i] if i < len(items) else {}
+            name_label.setText(item.get('name', ''))
+            name_label.setVisible(i < len(items))
+            
+            if 'details' in item:
+                details_label.setText(item['details'])
+            details_label.setVisible('details' in item)
+            
+            if 'progress' in item:
+                progress_bar.setValue(int(item['progress']))
+            progress_bar.setVisible('progress' in item)
+
+class CardPool:
+    """Cards kept by slot so that refreshes reuse them instead of rebuilding"""
+    
+    def __init__(self):
+        self._slots = {}
+    
+    def __len__(self):
+        return len(self._slots)
+    
+    def clean_card(self, key, grid, column, title, value, subtitle="", progress=None, details=None, graph_data=None):
+        """Create a card in the grid on first use, otherwise update it in place"""
+        card = self._slots.get(key)
+        if card is None:
+            card = CleanCard(title, value, subtitle, progress, details, graph_data)
+            grid.addWidget(card, 0, column)
+            self._slots[key] = card
+        else:
+            card.set_content(title, value, subtitle, progress, details, graph_data)
+        return card
+    
+    def detail_card(self, key, layout, title, items):
+        """Create a detail card in the layout on first use, otherwise update its rows in place"""
+        card = self._slots.get(key)
+        if card is None:
+            card = DetailCard(title, items)
+            layout.addWidget(card)
+            self._slots[key] = card
+        else:
+            card.set_items(items)
+        card.setVisible(bool(items))
+        return card
 
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("System Spec Analyzer")
-        self.setMinimumSize(1280, 720)
-        self.resize(1280, 720)
-        
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #0f0f0f;
-            }
-        """)
+        # Sizes are in device-independent pixels with HiDPI scaling, so a
+        # 1080p screen at 150% only offers about 1280x690 of usable space
+        width, height = 1280, 720
+        screen = QApplication.primaryScreen()
+        if screen is not None:
+            available = screen.availableGeometry()
+            width = min(width, available.width())
+            height = min(height, available.height())
+        self.setMinimumSize(width, height)
+        self.resize(width, height)
         
         self.system_info = {}
+        self.cards = CardPool()
         self.is_loading = True
+        self.is_scanning = False
         self.setup_ui()
         
+        # One worker lives on its own thread for the whole session; each
+        # refresh is a queued call into it
+        self._worker_thread = QThread(self)
+        self.worker = SystemInfoWorker()
+        self.worker.moveToThread(self._worker_thread)
+        self.worker.info_ready.connect(self.update_specs)
+        self.worker.progress_update.connect(self.loading_widget.update_progress)
+        self._worker_thread.start()
+        # The application can quit without this window being closed first;
+        # a QThread destroyed while running aborts the process
+        QApplication.instance().aboutToQuit.connect(self._stop_worker)
+        
         # Auto-refresh timer (only after initial load)
         self.refresh_timer = QTimer()
         self.refresh_timer.timeout.connect(self.refresh_specs)
+    
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Initial load with loading screen, or catch up after being hidden;
+        # deferred so the window paints before the scan competes for the GIL
+        QTimer.singleShot(0, self.resume_refresh)
+    
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+    
+    def closeEvent(self, event):
+        self._stop_worker()
+        super().closeEvent(event)
+    
+    def _stop_worker(self):
+        """Stop the worker thread, letting a scan in progress finish first"""
+        self._worker_thread.quit()
+        self._worker_thread.wait()
+        self.worker.shutdown()
+    
+    def changeEvent(self, event):
+        if event.type() == QEvent.WindowStateChange:
+            if self.isMinimized():
+                self.refresh_timer.stop()
+            else:
+                self.resume_refresh()
+        super().changeEvent(event)
+    
+    def resume_refresh(self):
+        """Restart auto-refresh and catch up after being hidden or minimized"""
+        if self.isMinimized() or self.refresh_timer.isActive():
+            return
         
-        # Initial load with loading screen
+        if self.cards:
+            self.refresh_timer.start(30000)  # Refresh every 30 seconds
         self.refresh_specs()
     
     def setup_ui(self):
         """Setup responsive UI without window controls"""
         central_widget = QWidget()
-        central_widget.setStyleSheet("""
-            QWidget {
-                background-color: #1a1a1a;
-                border-radius: 12px;
-            }
-        """)
         self.setCentralWidget(central_widget)
         
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.setSpacing(0)
         
-        # Title bar without window controls
-        title_bar = QWidget()
-        title_bar.setFixedHeight(50)
-        title_bar.setStyleSheet("""
-            QWidget {
-                background-color: #1e1e1e;
-                border-bottom: 1px solid #2a2a2a;
-                border-radius: 0;
-            }
-        """)
-        
-        title_layout = QHBoxLayout()
-        title_layout.setContentsMargins(20, 0, 20, 0)
-        
-        # Title only - no window controls
-        # title_label = QLabel("System Spec Analyzer")
-        # title_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        # title_label.setStyleSheet("""
-        #     QLabel {
-        #         color: #ffffff;
-        #         font-size: 14px;
-        #         font-weight: 500;
-        #         border: none;
-        #     }
-        # """)
-        # title_layout.addWidget(title_label)
-        # title_layout.addStretch()
-        
-        # title_bar.setLayout(title_layout)
-        # main_layout.addWidget(title_bar)
-        
         # Content area - will switch between loading and main content
-        self.content_stack = QWidget()
-        self.content_stack_layout = QVBoxLayout()
-        self.content_stack_layout.setContentsMargins(0, 0, 0, 0)
-        self.content_stack.setLayout(self.content_stack_layout)
+        self.content_stack = QStackedWidget()
         
         # Loading widget
         self.loading_widget = LoadingWidget()
-        self.content_stack_layout.addWidget(self.loading_widget)
+        self.content_stack.addWidget(self.loading_widget)
+        
+        # Main content area, built on the first update
+        self.main_content = None
+        self.content_layout = None
+        
+        main_layout.addWidget(self.content_stack)
         
-        # Main content area (initially hidden)
+        central_widget.setLayout(main_layout)
+    
+    def build_main_content(self):
+        """Create the scrollable main content page"""
         self.main_content = QScrollArea()
         self.main_content.setWidgetResizable(True)
         self.main_content.setStyleSheet("""
@@ -1063,77 +1788,73 @@ class MainWindow(QMainWindow):
         
         content_widget.setLayout(self.content_layout)
         self.main_content.setWidget(content_widget)
-        self.main_content.hide()  # Initially hidden
         
-        self.content_stack_layout.addWidget(self.main_content)
-        main_layout.addWidget(self.content_stack)
-        
-        central_widget.setLayout(main_layout)
+        self.content_stack.addWidget(self.main_content)
     
     def show_loading(self):
         """Show loading screen"""
-        self.loading_widget.show()
-        self.main_content.hide()
+        self.content_stack.setCurrentWidget(self.loading_widget)
         self.is_loading = True
     
     def show_main_content(self):
         """Show main content and hide loading"""
-        self.loading_widget.hide()
-        self.main_content.show()
+        self.content_stack.setCurrentWidget(self.main_content)
         self.is_loading = False
         
-        # Start auto-refresh timer after first load
-        if not self.refresh_timer.isActive():
+        # Start auto-refresh timer after first load, unless nobody can see it
+        if not self.refresh_timer.isActive() and self.isVisible() and not self.isMinimized():
             self.refresh_timer.start(30000)  # Refresh every 30 seconds
     
     def refresh_specs(self):
         """Refresh system specifications"""
+        # Nothing to refresh while hidden, and never overlap a running scan
+        if not self.isVisible() or self.isMinimized():
+            return
+        if self.is_scanning:
+            return
+        
         if not self.is_loading:
             self.show_loading()
         
-        self.worker = SystemInfoWorker()
-        self.worker.info_ready.connect(self.update_specs)
-        self.worker.progress_update.connect(self.loading_widget.update_progress)
-        self.worker.start()
+        self.is_scanning = True
+        QMetaObject.invokeMethod(self.worker, "do_refresh", Qt.QueuedConnection)
     
     def update_specs(self, info):
         """Update UI with comprehensive system information"""
         self.system_info = info
+        self.is_scanning = False
         
-        # Clear existing content
-        for i in reversed(range(self.content_layout.count())):
-            child = self.content_layout.itemAt(i).widget()
-            if child:
-                child.setParent(None)
+        # Cards are built on the first update and refreshed in place afterwards
+        building = not self.cards
+        if self.main_content is None:
+            self.build_main_content()
         
         # System Overview
-        self.add_section("System Overview")
-        overview_grid = QGridLayout()
-        overview_grid.setSpacing(12)
+        overview_grid = self.add_grid_section("System Overview") if building else None
         
         # OS Card
         os_details = [
-            f"Build: {info.get('os_build', 'Unknown')[:20]}...",
+            f"Build: {_ellipsize(info.get('os_build', 'Unknown'), 20)}",
             f"Architecture: {info.get('os_architecture', 'Unknown')}",
             f"Machine: {info.get('machine_type', 'Unknown')}"
         ]
         
-        os_card = CleanCard(
+        self.cards.clean_card(
+            'os', overview_grid, 0,
             "Operating System",
             info.get('os_full', 'Unknown OS'),
             f"Uptime: {info.get('uptime', 'Unknown')}",
             details=os_details
         )
-        overview_grid.addWidget(os_card, 0, 0)
         
         # System Identity
-        identity_card = CleanCard(
+        self.cards.clean_card(
+            'identity', overview_grid, 1,
             "System Identity",
             info.get('hostname', 'Unknown'),
             f"User: {info.get('username', 'Unknown')}",
             details=[f"Boot Time: {info.get('boot_time', 'Unknown')}"]
         )
-        overview_grid.addWidget(identity_card, 0, 1)
         
         # Motherboard Card
         motherboard = info.get('motherboard', {})
@@ -1146,38 +1867,39 @@ class MainWindow(QMainWindow):
             f"Version: {motherboard.get('version', 'Unknown')}"
         ]
         
-        motherboard_card = CleanCard(
+        self.cards.clean_card(
+            'motherboard', overview_grid, 2,
             "Motherboard",
             motherboard_name,
             f"Chipset: {motherboard.get('manufacturer', 'Unknown')}",
             details=motherboard_details
         )
-        overview_grid.addWidget(motherboard_card, 0, 2)
-        
-        self.add_layout(overview_grid)
         
         # Processing & Performance
-        self.add_section("Processing & Performance")
-        performance_grid = QGridLayout()
-        performance_grid.setSpacing(12)
+        performance_grid = self.add_grid_section("Processing & Performance") if building else None
         
         # CPU Card with per-core graph
-        processor = info.get('processor', 'Unknown Processor')
-        if len(processor) > 30:
-            processor = processor[:27] + "..."
+        processor = _ellipsize(info.get('processor', 'Unknown Processor'), 30)
+        
+        cpu_phys = info.get('cpu_cores_physical', 0)
+        cpu_log = info.get('cpu_cores_logical', 0)
+        cpu_cur = info.get('cpu_freq_current', 0)
+        cpu_max = info.get('cpu_freq_max', 0)
+        cpu_usage = info.get('cpu_usage', 0)
+        cpu_vendor = info.get('cpu_vendor', 'Unknown')
         
-        cpu_cores = f"{info.get('cpu_cores_physical', 0)} cores"
-        if info.get('cpu_cores_logical', 0) != info.get('cpu_cores_physical', 0):
-            cpu_cores += f" ({info.get('cpu_cores_logical', 0)} threads)"
+        cpu_cores = f"{cpu_phys} cores"
+        if cpu_log != cpu_phys:
+            cpu_cores += f" ({cpu_log} threads)"
         
         cpu_freq = ""
-        if info.get('cpu_freq_current', 0) > 0:
-            cpu_freq = f" • {info.get('cpu_freq_current', 0):.1f} GHz"
-            if info.get('cpu_freq_max', 0) > info.get('cpu_freq_current', 0):
-                cpu_freq += f" (max {info.get('cpu_freq_max', 0):.1f} GHz)"
+        if cpu_cur > 0:
+            cpu_freq = f" • {cpu_cur:.1f} GHz"
+            if cpu_max > cpu_cur:
+                cpu_freq += f" (max {cpu_max:.1f} GHz)"
         
         cpu_details = [
-            f"Vendor: {info.get('cpu_vendor', 'Unknown')}",
+            f"Vendor: {cpu_vendor}",
             f"Family: {info.get('cpu_family', 'Unknown')} Model: {info.get('cpu_model', 'Unknown')}"
         ]
         
@@ -1185,15 +1907,15 @@ class MainWindow(QMainWindow):
         if info.get('cpu_cache_l3') != 'Unknown':
             cpu_details.append(f"L3 Cache: {info.get('cpu_cache_l3', 'Unknown')}")
         
-        cpu_card = CleanCard(
+        self.cards.clean_card(
+            'cpu', performance_grid, 0,
             "Processor",
             processor,
             cpu_cores + cpu_freq,
-            progress=info.get('cpu_usage', 0),
+            progress=cpu_usage,
             details=cpu_details,
             graph_data=info.get('cpu_usage_per_core', [])
         )
-        performance_grid.addWidget(cpu_card, 0, 0)
         
         # Memory Card with capabilities
         ram_total = info.get('ram_total_gb', 0)
@@ -1208,152 +1930,71 @@ class MainWindow(QMainWindow):
             f"Type: {memory_capabilities.get('memory_type', 'Unknown')}"
         ]
         
-        if info.get('swap_total_gb', 0) > 0:
-            memory_details.append(f"Swap: {info.get('swap_used_gb', 0):.1f}/{info.get('swap_total_gb', 0):.1f} GB")
+        swap_total = info.get('swap_total_gb', 0)
+        if swap_total > 0:
+            memory_details.append(f"Swap: {info.get('swap_used_gb', 0):.1f}/{swap_total:.1f} GB")
         
-        memory_card = CleanCard(
+        self.cards.clean_card(
+            'memory', performance_grid, 1,
             "Memory",
             f"{ram_total:.0f} GB RAM",
             f"Used: {ram_used:.1f} GB ({ram_percent:.0f}%)",
             progress=ram_percent,
             details=memory_details
         )
-        performance_grid.addWidget(memory_card, 0, 1)
-        
-        # GPU Card with detailed information
-        gpu_devices = info.get('gpu_devices', [])
-        if gpu_devices:
-            gpu = gpu_devices[0]
-            gpu_name = gpu['name']
-            if len(gpu_name) > 25:
-                gpu_name = gpu_name[:22] + "..."
-            
-            gpu_subtitle = ""
-            gpu_progress = None
-            gpu_details = []
-            
-            if 'memory_total' in gpu:
-                gpu_subtitle = f"{gpu['memory_total']} MB VRAM"
-                if 'load' in gpu:
-                    gpu_progress = gpu['load']
-                    gpu_subtitle += f" • {gpu['load']:.0f}% load"
-                
-                gpu_details.append(f"Memory Used: {gpu.get('memory_used', 0)} MB")
-                gpu_details.append(f"Memory Free: {gpu.get('memory_free', 0)} MB")
-                
-                if gpu.get('temperature'):
-                    gpu_details.append(f"Temperature: {gpu['temperature']:.0f}°C")
-            
-            gpu_card = CleanCard(
+        
+        # GPU Card with detailed information, formatted by the worker
+        gpu_card = info.get('gpu_card')
+        if gpu_card:
+            self.cards.clean_card(
+                'gpu', performance_grid, 2,
                 "Graphics",
-                gpu_name,
-                gpu_subtitle,
-                progress=gpu_progress,
-                details=gpu_details
+                gpu_card['name'],
+                gpu_card['subtitle'],
+                progress=gpu_card['progress'],
+                details=gpu_card['details']
             )
         else:
-            gpu_card = CleanCard(
+            self.cards.clean_card(
+                'gpu', performance_grid, 2,
                 "Graphics",
                 "Integrated Graphics",
                 "No dedicated GPU detected"
             )
         
-        performance_grid.addWidget(gpu_card, 0, 2)
-        
-        self.add_layout(performance_grid)
-        
         # Storage & Network with Capabilities
-        self.add_section("Storage & Network")
-        
-        # Storage Devices with capabilities
-        storage_devices = info.get('storage_devices', [])
-        storage_capabilities = info.get('storage_capabilities', {})
-        storage_items = []
-        
-        for device in storage_devices[:4]:
-            device_name = device['device']
-            if platform.system() == "Windows":
-                device_name = f"Drive {device['device']}"
-            
-            details = f"{device['used_gb']:.0f} GB used • {device['fstype']}"
-            if device.get('io_stats'):
-                io = device['io_stats']
-                details += f" • R: {io['read_bytes']:.1f} GB W: {io['write_bytes']:.1f} GB"
-            
-            storage_items.append({
-                'name': f"{device_name} ({device['total_gb']:.0f} GB)",
-                'details': details,
-                'progress': device['percent']
-            })
-        
-        # Add capabilities info
-        if storage_capabilities:
-            storage_items.append({
-                'name': f"Max Capacity: {storage_capabilities.get('max_capacity', 'Unknown')}",
-                'details': f"Interfaces: {', '.join(storage_capabilities.get('interface_types', [])[:2])}"
-            })
+        if building:
+            self.add_section("Storage & Network")
         
-        if storage_items:
-            storage_card = DetailCard("Storage Devices & Capabilities", storage_items)
-            self.content_layout.addWidget(storage_card)
+        # Storage Devices with capabilities, formatted by the worker
+        storage_items = info.get('storage_items', [])
+        self.cards.detail_card('storage', self.content_layout, "Storage Devices & Capabilities", storage_items)
         
-        # Network Interfaces
-        network_interfaces = info.get('network_interfaces', [])
-        network_items = []
-        
-        for interface in network_interfaces[:4]:
-            status = "🟢 Connected" if interface['is_up'] else "🔴 Disconnected"
-            ip_addr = interface['addresses'][0]['address'] if interface['addresses'] else "No IP"
-            
-            details = f"{status} • {ip_addr}"
-            
-            if interface['speed'] > 0:
-                if interface['speed'] >= 1000:
-                    details += f" • {interface['speed']//1000} Gbps"
-                else:
-                    details += f" • {interface['speed']} Mbps"
-            
-            if interface.get('io_stats'):
-                io = interface['io_stats']
-                details += f" • ↑{io['bytes_sent']:.0f} MB ↓{io['bytes_recv']:.0f} MB"
-            
-            network_items.append({
-                'name': interface['name'],
-                'details': details
-            })
-        
-        if network_items:
-            network_card = DetailCard("Network Interfaces", network_items)
-            self.content_layout.addWidget(network_card)
+        # Network Interfaces, formatted by the worker
+        network_items = info.get('network_items', [])
+        self.cards.detail_card('network', self.content_layout, "Network Interfaces", network_items)
         
         # Power & Sensors
-        self.add_section("Power & Sensors")
-        sensors_grid = QGridLayout()
-        sensors_grid.setSpacing(12)
+        sensors_grid = self.add_grid_section("Power & Sensors") if building else None
         
         # Battery Card
         battery = info.get('battery')
         if battery:
-            battery_status = "🔌 Charging" if battery['plugged'] else "🔋 On Battery"
-            battery_subtitle = f"{battery_status}"
-            if battery['time_left']:
-                battery_subtitle += f" • {battery['time_left']} remaining"
-            
-            battery_card = CleanCard(
+            self.cards.clean_card(
+                'battery', sensors_grid, 0,
                 "Battery",
                 f"{battery['percent']:.0f}%",
-                battery_subtitle,
+                info.get('battery_subtitle', ''),
                 progress=battery['percent']
             )
         else:
-            battery_card = CleanCard(
+            self.cards.clean_card(
+                'battery', sensors_grid, 0,
                 "Power",
                 "AC Power",
                 "Desktop system • No battery"
             )
         
-        sensors_grid.addWidget(battery_card, 0, 0)
-        
         # Temperature Card with multiple sensors
         temperatures = info.get('temperatures', {})
         temp_details = []
@@ -1369,21 +2010,21 @@ class MainWindow(QMainWindow):
                 temp_details.append(f"{sensor_display}: {temp:.0f}°C")
         
         if cpu_temp:
-            temp_card = CleanCard(
+            self.cards.clean_card(
+                'temperature', sensors_grid, 1,
                 "Temperature",
                 f"{cpu_temp:.0f}°C",
                 "CPU temperature",
                 details=temp_details[:3]
             )
         else:
-            temp_card = CleanCard(
+            self.cards.clean_card(
+                'temperature', sensors_grid, 1,
                 "Temperature",
                 "N/A",
                 "No sensors detected"
             )
         
-        sensors_grid.addWidget(temp_card, 0, 1)
-        
         # System Load Card with process information
         process_count = info.get('process_count', 0)
         process_running = info.get('process_running', 0)
@@ -1399,43 +2040,34 @@ class MainWindow(QMainWindow):
         if load_avg:
             load_details.append(f"Load Avg: {load_avg['1min']}")
         
-        load_card = CleanCard(
+        self.cards.clean_card(
+            'load', sensors_grid, 2,
             "System Load",
             f"{process_count} processes",
-            f"CPU: {info.get('cpu_usage', 0):.0f}% • RAM: {info.get('ram_percent', 0):.0f}%",
+            f"CPU: {cpu_usage:.0f}% • RAM: {ram_percent:.0f}%",
             details=load_details
         )
-        sensors_grid.addWidget(load_card, 0, 2)
-        
-        self.add_layout(sensors_grid)
         
         # Advanced Details
-        self.add_section("Advanced Details")
-        advanced_grid = QGridLayout()
-        advanced_grid.setSpacing(12)
+        advanced_grid = self.add_grid_section("Advanced Details") if building else None
         
         # CPU Features Card
         cpu_flags = info.get('cpu_flags', [])
-        cpu_features = []
+        cpu_features = info.get('cpu_key_features', [])
         
-        # Check for important CPU features
-        important_features = ['avx2', 'sse4_2', 'aes', 'vmx', 'svm', 'rdrand', 'rdseed']
-        for feature in important_features:
-            if any(feature in flag.lower() for flag in cpu_flags):
-                cpu_features.append(feature.upper())
-        
-        cpu_features_card = CleanCard(
+        self.cards.clean_card(
+            'cpu_features', advanced_grid, 0,
             "CPU Features",
             f"{len(cpu_flags)} instruction sets",
             f"Key features: {', '.join(cpu_features[:4])}",
-            details=[f"Total flags: {len(cpu_flags)}", f"Architecture: {info.get('cpu_vendor', 'Unknown')}"]
+            details=[f"Total flags: {len(cpu_flags)}", f"Architecture: {cpu_vendor}"]
         )
-        advanced_grid.addWidget(cpu_features_card, 0, 0)
         
         # Network Statistics Card
         net_stats = info.get('network_stats', {})
         if net_stats:
-            net_card = CleanCard(
+            self.cards.clean_card(
+                'network_stats', advanced_grid, 1,
                 "Network Statistics",
                 f"{net_stats.get('total_bytes_recv', 0):.1f} GB received",
                 f"{net_stats.get('total_bytes_sent', 0):.1f} GB sent",
@@ -1445,14 +2077,13 @@ class MainWindow(QMainWindow):
                 ]
             )
         else:
-            net_card = CleanCard(
+            self.cards.clean_card(
+                'network_stats', advanced_grid, 1,
                 "Network Statistics",
                 "No data available",
                 "Network statistics not accessible"
             )
         
-        advanced_grid.addWidget(net_card, 0, 1)
-        
         # Fan Information Card
         fans = info.get('fans', {})
         fan_details = []
@@ -1464,25 +2095,24 @@ class MainWindow(QMainWindow):
                 fan_count += 1
         
         if fan_count > 0:
-            fan_card = CleanCard(
+            self.cards.clean_card(
+                'fans', advanced_grid, 2,
                 "System Fans",
                 f"{fan_count} fans detected",
                 "Fan speeds monitored",
                 details=fan_details[:3]
             )
         else:
-            fan_card = CleanCard(
+            self.cards.clean_card(
+                'fans', advanced_grid, 2,
                 "System Fans",
                 "No fans detected",
                 "Fan monitoring not available"
             )
         
-        advanced_grid.addWidget(fan_card, 0, 2)
-        
-        self.add_layout(advanced_grid)
-        
         # Add stretch at the end
-        self.content_layout.addStretch()
+        if building:
+            self.content_layout.addStretch()
         
         # Show main content after loading is complete
         self.show_main_content()
@@ -1491,15 +2121,7 @@ class MainWindow(QMainWindow):
         """Add a section title"""
         section_label = QLabel(title)
         section_label.setTextInteractionFlags(Qt.TextSelectableByMouse)
-        section_label.setStyleSheet("""
-            QLabel {
-                color: #ffffff;
-                font-size: 18px;
-                font-weight: 600;
-                margin: 8px 0;
-                border: none;
-            }
-        """)
+        section_label.setObjectName("sectionTitle")
         self.content_layout.addWidget(section_label)
     
     def add_layout(self, layout):
@@ -1507,42 +2129,108 @@ class MainWindow(QMainWindow):
         widget = QWidget()
         widget.setLayout(layout)
         self.content_layout.addWidget(widget)
+    
+    def add_grid_section(self, title):
+        """Add a section title followed by an empty card grid"""
+        self.add_section(title)
+        grid = QGridLayout()
+        grid.setSpacing(12)
+        self.add_layout(grid)
+        return grid
+
+# Minimal dark application palette as (role, colour) pairs
+_PAL_ENTRIES = (
+    (QPalette.Window, COLOR_BG_WINDOW),
+    (QPalette.WindowText, COLOR_TEXT),
+    (QPalette.Base, COLOR_BG_BASE),
+    (QPalette.AlternateBase, COLOR_BG_CARD),
+    (QPalette.ToolTipBase, COLOR_BG_CARD),
+    (QPalette.ToolTipText, COLOR_TEXT),
+    (QPalette.Text, COLOR_TEXT),
+    (QPalette.Button, COLOR_BG_CARD),
+    (QPalette.ButtonText, COLOR_TEXT),
+    (QPalette.BrightText, COLOR_TEXT),
+    (QPalette.Link, COLOR_ACCENT),
+    (QPalette.Highlight, COLOR_ACCENT),
+    (QPalette.HighlightedText, COLOR_TEXT),
+)
+
+_DARK_PALETTE = None
+
+def _build_palette():
+    """Build the minimal dark application palette"""
+    palette = QPalette()
+    set_color = palette.setColor
+    for role, color in _PAL_ENTRIES:
+        set_color(role, color)
+    return palette
 
 def main():
-    app = QApplication(sys.argv)
+    global _DARK_PALETTE
+    # Reuse an application that already exists (a test harness or an
+    # embedded shell); it has been configured and owns the event loop
+    app = QApplication.instance()
+    created = app is None
     
-    # Set application properties
-    app.setApplicationName("System Spec Analyzer")
-    app.setApplicationVersion("1.0")
-    app.setStyle('Fusion')
-    
-    # Set clean font
-    font = QFont("Segoe UI", 9)
-    if not font.exactMatch():
-        font = QFont("Arial", 9)
-    app.setFont(font)
-    
-    # Set minimal dark palette
-    palette = QPalette()
-    palette.setColor(QPalette.Window, QColor(15, 15, 15))
-    palette.setColor(QPalette.WindowText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Base, QColor(26, 26, 26))
-    palette.setColor(QPalette.AlternateBase, QColor(42, 42, 42))
-    palette.setColor(QPalette.ToolTipBase, QColor(42, 42, 42))
-    palette.setColor(QPalette.ToolTipText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Text, QColor(255, 255, 255))
-    palette.setColor(QPalette.Button, QColor(42, 42, 42))
-    palette.setColor(QPalette.ButtonText, QColor(255, 255, 255))
-    palette.setColor(QPalette.BrightText, QColor(255, 255, 255))
-    palette.setColor(QPalette.Link, QColor(0, 102, 204))
-    palette.setColor(QPalette.Highlight, QColor(0, 102, 204))
-    palette.setColor(QPalette.HighlightedText, QColor(255, 255, 255))
-    app.setPalette(palette)
+    if created:
+        # pyqtdarktheme 2.x, when installed, supplies the base theme
+        qdarktheme = _optional_module('qdarktheme')
+        use_qdarktheme = hasattr(qdarktheme, 'setup_theme')
+        
+        # HiDPI scaling must be set before the application object exists, or the
+        # first window is laid out again once the screen scale is known
+        QApplication.setAttribute(Qt.AA_EnableHighDpiScaling, True)
+        QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
+        if hasattr(QApplication, 'setHighDpiScaleFactorRoundingPolicy'):  # Qt 5.14+
+            QApplication.setHighDpiScaleFactorRoundingPolicy(
+                Qt.HighDpiScaleFactorRoundingPolicy.PassThrough)
+        
+        app = QApplication(sys.argv)
+        
+        # Set application properties
+        app.setApplicationName("System Spec Analyzer")
+        app.setApplicationVersion("1.0")
+        app.setStyle('Fusion')
+        
+        # Set clean font; the platform UI font (Segoe UI on Windows) is already
+        # resolved, so no missing family sends Qt searching the font database
+        font = app.font()
+        font.setPointSize(9)
+        app.setFont(font)
+        
+        if use_qdarktheme:
+            # The card styles go on top of the theme's own stylesheet
+            qdarktheme.setup_theme("dark", custom_colors={"primary": COLOR_ACCENT.name()},
+                                   additional_qss=_APP_QSS)
+        else:
+            # Set minimal dark palette, built once and reused
+            app.setStyleSheet(_APP_QSS)
+            if _DARK_PALETTE is None:
+                _DARK_PALETTE = _build_palette()
+            app.setPalette(_DARK_PALETTE)
     
     window = MainWindow()
+    if not created:
+        # The card styles live in _APP_QSS; scope them to the window so the
+        # host's own style sheet is left alone
+        window.setStyleSheet(_APP_QSS)
     window.show()
     
-    sys.exit(app.exec_())
+    if not created:
+        # The host's event loop drives the window and the host may keep it
+        # for as long as it likes: the worker thread is stopped on
+        # aboutToQuit, so quitting without closing the window is safe
+        return window
+    
+    exit_code = app.exec_()
+    
+    # closeEvent has already stopped the worker thread; skip interpreter
+    # teardown, which would garbage-collect the widget tree and join any
+    # disk usage probe still stalled on an unresponsive mount
+    for stream in (sys.stdout, sys.stderr):
+        if stream is not None:
+            stream.flush()
+    os._exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file